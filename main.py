@@ -9,8 +9,15 @@ import xml.etree.ElementTree as ET
 from xml.dom import minidom
 import json
 import hashlib
+import random
 import re
+import shutil
+import tempfile
+import time
+import tracemalloc
 import requests
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from email.utils import parsedate_to_datetime
 
 # -----------------------------
@@ -70,10 +77,32 @@ SEEN_FILE        = "seen_ids.json"
 MASTER_SEEN_FILE = "master_seen_ids.json"   # persistent master dedup
 SOURCES_FILE     = "sources.txt"
 EMPTY_FILE       = "empty_feeds.xml"
-
-MAX_ITEMS           = 500
-SEEN_RETENTION_DAYS = 365
-FETCH_TIMEOUT       = 15  # seconds per feed
+CURSOR_FILE      = "feed_cursors.json"      # per-feed high-water marks
+PARTIAL_DIR      = "partials"               # --shard output, --merge input
+
+MAX_ITEMS              = 500
+SEEN_RETENTION_DAYS    = 365
+CURSOR_FULL_SCAN_EVERY = 48         # runs between full scans that re-check a feed's order
+CURSOR_GUARD           = 3          # ids kept from just below the cursor to spot inserts there
+FETCH_TIMEOUT          = 15         # seconds per feed
+PARSE_CHUNK_SIZE       = 16 * 1024  # bytes fed to the streaming XML parser at a time
+DATE_CACHE_SIZE        = 4096       # raw date strings memoized by normalize_date()
+
+# Record/replay of HTTP traffic (set from --record / --replay on the command line)
+RECORD_DIR        = None   # store every fetched response here
+REPLAY_DIR        = None   # serve responses from here instead of the network
+REPLAY_LATENCY    = 0.0    # extra seconds per replayed request, or "recorded"
+REPLAY_FAIL_RATE  = 0.0    # fraction of replayed requests that fail
+REPLAY_SCALE      = 0      # >0: replace FEEDS with this many synthetic URLs
+REPLAY_SEED       = 0      # seeds failure injection for repeatable runs
+REPLAY_OUT_DIR    = None   # replay writes its state and outputs here (default: a temp dir)
+CAPTURE_INDEX     = "index.json"
+CAPTURE_STATE_DIR = "state"  # starting state files, snapshotted by --record
+
+# Memory accounting (--memory-report / --memory-ceiling MB)
+MEMORY_REPORT       = False  # print per-stage / per-feed tracemalloc figures
+MEMORY_CEILING_MB   = None   # fail at the end of a stage whose traced peak went above this
+MEMORY_REPORT_FEEDS = 20     # feeds listed in the per-feed part of the report
 
 # -----------------------------
 # SEEN-IDS HELPERS (daily feed)
@@ -144,6 +173,243 @@ def save_master_seen(seen: dict):
         json.dump({"seen_ids": pruned}, f, indent=2)
 
 
+# -----------------------------
+# PER-FEED CURSORS
+# Newest entry id/date seen at the top of each feed. Feeds are almost
+# always newest-first, so once the cursor entry is reached the rest of
+# the feed is known territory and the entry loop can stop there.
+# A feed found out of order, with an entry slotted in below the cursor
+# (a sticky top item, an aggregator back-filling an older post), or due
+# a periodic re-check is fully scanned.
+# -----------------------------
+
+def load_cursors():
+    if not os.path.exists(CURSOR_FILE):
+        return {}
+    try:
+        with open(CURSOR_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("cursors", {})
+    except Exception:
+        return {}
+
+
+def save_cursors(cursors: dict):
+    feeds  = set(FEEDS)
+    pruned = {url: c for url, c in cursors.items() if url in feeds}
+    with open(CURSOR_FILE, "w", encoding="utf-8") as f:
+        json.dump({"cursors": pruned}, f, indent=2)
+
+
+def dates_in_order(dates, floor=None):
+    """True if dates are newest-first and none is older than floor."""
+    prev = None
+    for dt in dates:
+        if prev is not None and dt > prev:
+            return False
+        if floor is not None and dt < floor:
+            return False
+        prev = dt
+    return True
+
+
+def cursor_stop_id(cursor):
+    """Id to stop at, or None when this run must scan the whole feed."""
+    if not cursor or not cursor.get("ordered"):
+        return None
+    if cursor.get("since_full_scan", 0) >= CURSOR_FULL_SCAN_EVERY:
+        return None
+    return cursor.get("id")
+
+
+def scan_window(entries, ids, dates, cursor, stop_id, total=None):
+    """
+    Trims (entries, ids, dates) to the part above the cursor and returns
+    (entries, ids, dates, new_cursor). ids and dates are callables so the
+    entries past the cursor never get an id or date computed, apart from
+    the CURSOR_GUARD entries just below it.
+
+    Falls back to the full feed when the new part is out of order, or when
+    something was inserted below the cursor: the guard ids under it changed,
+    or `total` (the feed's entry count, when known) grew by more than the
+    new entries account for.
+    """
+    window_entries, window_ids = [], []
+    below = None   # ids just under the cursor entry, if it was found
+    for i, entry in enumerate(entries):
+        entry_id = ids(entry)
+        if entry_id == stop_id:
+            below = [ids(e) for e in entries[i + 1:i + 1 + CURSOR_GUARD]]
+            break
+        window_entries.append(entry)
+        window_ids.append(entry_id)
+    window_dates = [dates(e) for e in window_entries]
+
+    floor     = datetime.fromisoformat(cursor["date"]) if stop_id else None
+    ordered   = dates_in_order(window_dates, floor)
+    full_scan = below is None
+    inserted  = False
+    if not full_scan:
+        old_below = cursor.get("below")
+        old_total = cursor.get("count")
+        # Entries falling off the bottom of a capped feed shorten `below`;
+        # anything else that changes it was slotted in under the cursor.
+        if old_below is not None and below != old_below[:len(below)]:
+            inserted = True
+        if total is not None and old_total is not None \
+                and total > old_total + len(window_entries):
+            inserted = True
+    if (not ordered or inserted) and not full_scan:
+        window_entries = list(entries)
+        window_ids     = [ids(e) for e in window_entries]
+        window_dates   = [dates(e) for e in window_entries]
+        full_scan      = True
+
+    if window_entries:
+        known = window_ids if full_scan else window_ids + [stop_id] + below
+        new_cursor = {
+            "id":              window_ids[0],
+            "date":            window_dates[0].isoformat(),
+            "below":           known[1:1 + CURSOR_GUARD],
+            "ordered":         ordered,
+            "since_full_scan": 0 if full_scan else cursor.get("since_full_scan", 0) + 1,
+        }
+    else:
+        new_cursor = dict(cursor, below=below,
+                          since_full_scan=cursor.get("since_full_scan", 0) + 1)
+    if total is not None:
+        new_cursor["count"] = total
+    else:
+        new_cursor.pop("count", None)
+    return window_entries, window_ids, window_dates, new_cursor
+
+
+# -----------------------------
+# DATE NORMALIZATION
+# Every date string in the pipeline goes through normalize_date().
+# Fast paths cover the RFC 822 form write_rss() emits and the common
+# ISO 8601 forms; anything else falls back to the email parser. The
+# format that worked last is tried first for the same feed, and results
+# are memoized in a bounded LRU keyed by the raw string.
+# -----------------------------
+
+_MONTHS = {m: i for i, m in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+     "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1)}
+
+_RFC822_RE = re.compile(
+    r"(?:[A-Za-z]{3},\s*)?(\d{1,2}) ([A-Za-z]{3}) (\d{4}) (\d{2}):(\d{2})(?::(\d{2}))?"
+    r" (?:([+-])(\d{2})(\d{2})|GMT|UTC|UT|Z)$"
+)
+
+_date_cache       = OrderedDict()   # raw string -> UTC datetime | None
+_feed_date_format = {}              # feed -> name of the parser that last worked
+
+
+def to_utc(dt):
+    """Aware UTC datetime; naive values are taken to be UTC already."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    try:
+        return dt.astimezone(timezone.utc)
+    except Exception:
+        return dt.replace(tzinfo=timezone.utc)
+
+
+def _parse_rfc822(text):
+    # Exact write_rss() layout, "Mon, 19 Oct 2026 10:00:00 +0000": slice it.
+    if len(text) == 31 and text[3] == "," and text[25] == " " and text[26] in "+-":
+        month = _MONTHS.get(text[8:11])
+        try:
+            dt = datetime(int(text[12:16]), month, int(text[5:7]),
+                          int(text[17:19]), int(text[20:22]), int(text[23:25]),
+                          tzinfo=timezone.utc)
+            offset = timedelta(hours=int(text[27:29]), minutes=int(text[29:31]))
+        except (TypeError, ValueError):
+            pass
+        else:
+            if offset:
+                dt = dt - offset if text[26] == "+" else dt + offset
+            return dt
+
+    m = _RFC822_RE.match(text)
+    if not m:
+        return None
+    day, mon, year, hh, mm, ss, sign, off_h, off_m = m.groups()
+    month = _MONTHS.get(mon.title())
+    if month is None:
+        return None
+    try:
+        dt = datetime(int(year), month, int(day), int(hh), int(mm), int(ss or 0),
+                      tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    if sign:
+        offset = timedelta(hours=int(off_h), minutes=int(off_m))
+        dt = dt - offset if sign == "+" else dt + offset
+    return dt
+
+
+def _parse_iso8601(text):
+    if len(text) < 10 or not text[:4].isdigit() or text[4] != "-":
+        return None
+    if text[-1] in "Zz":
+        text = text[:-1] + "+00:00"
+    try:
+        return to_utc(datetime.fromisoformat(text))
+    except ValueError:
+        return None
+
+
+def _parse_email(text):
+    try:
+        dt = parsedate_to_datetime(text)
+    except Exception:
+        return None
+    return to_utc(dt) if dt is not None else None
+
+
+_DATE_PARSERS = (
+    ("rfc822",  _parse_rfc822),
+    ("iso8601", _parse_iso8601),
+    ("email",   _parse_email),
+)
+
+
+def normalize_date(raw, feed=None):
+    """
+    Parses a date string to an aware UTC datetime, or returns None.
+    `feed` is any hashable key (url, file path) used to remember which
+    format that source uses.
+    """
+    if not raw:
+        return None
+    try:
+        dt = _date_cache[raw]
+        _date_cache.move_to_end(raw)
+        return dt
+    except KeyError:
+        pass
+
+    text    = raw.strip()
+    hint    = _feed_date_format.get(feed)
+    parsers = _DATE_PARSERS
+    if hint is not None and hint != parsers[0][0]:
+        parsers = sorted(parsers, key=lambda p: p[0] != hint)
+
+    dt = None
+    for name, parser in parsers:
+        dt = parser(text)
+        if dt is not None:
+            if feed is not None:
+                _feed_date_format[feed] = name
+            break
+
+    _date_cache[raw] = dt
+    if len(_date_cache) > DATE_CACHE_SIZE:
+        _date_cache.popitem(last=False)
+    return dt
+
+
 # -----------------------------
 # UTILITIES
 # -----------------------------
@@ -174,7 +440,7 @@ def get_unique_id(entry):
     return hashlib.md5(f"{title}{published}".encode("utf-8")).hexdigest()
 
 
-def parse_date(entry):
+def parse_date(entry, feed=None):
     for field in ("published_parsed", "updated_parsed", "created_parsed"):
         try:
             t = entry.get(field) if isinstance(entry, dict) else getattr(entry, field, None)
@@ -191,15 +457,9 @@ def parse_date(entry):
         except Exception:
             val = None
         if val:
-            try:
-                dt = parsedate_to_datetime(val)
-                if dt is None:
-                    continue
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt.astimezone(timezone.utc)
-            except Exception:
-                continue
+            dt = normalize_date(val, feed)
+            if dt is not None:
+                return dt
     return datetime.now(timezone.utc)
 
 
@@ -213,6 +473,331 @@ def extract_source(link):
         return "unknown"
 
 
+# -----------------------------
+# HTTP RECORD / REPLAY
+# Every request goes through http_get(). With RECORD_DIR set, the
+# response (status, headers, body, timing) is written to disk; with
+# REPLAY_DIR set, the stored responses are served back instead, so a
+# past run can be repeated offline against the exact same bytes.
+# Recording also snapshots the state files the run starts from; a replay
+# starts from that snapshot in a scratch directory, so repeated replays
+# do the same work and never touch the repo's own state files.
+# -----------------------------
+
+_capture_index = None
+_replay_rng    = None
+_recorded      = set()   # urls already captured this run — the first response wins
+
+
+class ReplayResponse:
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers     = headers
+        self.content     = content
+
+
+def _capture_key(url):
+    return hashlib.md5(url.encode("utf-8")).hexdigest()
+
+
+def _load_capture_index(directory):
+    path = os.path.join(directory, CAPTURE_INDEX)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _record(url, record):
+    global _capture_index
+    if _capture_index is None:
+        _capture_index = _load_capture_index(RECORD_DIR)
+    _capture_index[url] = record
+    _recorded.add(url)
+    with open(os.path.join(RECORD_DIR, CAPTURE_INDEX), "w", encoding="utf-8") as f:
+        json.dump(_capture_index, f, indent=2)
+
+
+def _state_files():
+    """Inputs a run reads before it writes anything."""
+    return (MASTER_FILE, MASTER_SEEN_FILE, CURSOR_FILE, SEEN_FILE)
+
+
+def start_recording():
+    """
+    Creates RECORD_DIR up front (so failed requests can be recorded too)
+    and snapshots the current state files into it.
+    """
+    state_dir = os.path.join(RECORD_DIR, CAPTURE_STATE_DIR)
+    os.makedirs(state_dir, exist_ok=True)
+    for path in _state_files():
+        snapshot = os.path.join(state_dir, os.path.basename(path))
+        if os.path.exists(path):
+            shutil.copyfile(path, snapshot)
+        elif os.path.exists(snapshot):
+            os.remove(snapshot)
+
+
+def start_replay(out_dir):
+    """
+    Copies the recorded state snapshot into out_dir and points every
+    state/output path at it. Returns out_dir.
+    """
+    global MASTER_FILE, DAILY_FILE, SEEN_FILE, MASTER_SEEN_FILE
+    global SOURCES_FILE, EMPTY_FILE, CURSOR_FILE, PARTIAL_DIR
+
+    out_dir   = out_dir or tempfile.mkdtemp(prefix="feed-replay-")
+    state_dir = os.path.join(REPLAY_DIR, CAPTURE_STATE_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    for path in _state_files():
+        name = os.path.basename(path)
+        if os.path.exists(os.path.join(state_dir, name)):
+            shutil.copyfile(os.path.join(state_dir, name), os.path.join(out_dir, name))
+        elif os.path.exists(os.path.join(out_dir, name)):
+            os.remove(os.path.join(out_dir, name))   # left over from an earlier replay
+
+    def moved(path):
+        return os.path.join(out_dir, os.path.basename(path))
+
+    MASTER_FILE      = moved(MASTER_FILE)
+    DAILY_FILE       = moved(DAILY_FILE)
+    SEEN_FILE        = moved(SEEN_FILE)
+    MASTER_SEEN_FILE = moved(MASTER_SEEN_FILE)
+    SOURCES_FILE     = moved(SOURCES_FILE)
+    EMPTY_FILE       = moved(EMPTY_FILE)
+    CURSOR_FILE      = moved(CURSOR_FILE)
+    PARTIAL_DIR      = moved(PARTIAL_DIR)
+    return out_dir
+
+
+def _synthetic_source(url):
+    """
+    Synthetic replay URLs look like '<captured url>#replay-<n>'.
+    Returns (captured_url, n) — n is None for a plain captured URL.
+    """
+    base, sep, tag = url.partition("#replay-")
+    if sep and tag.isdigit():
+        return base, int(tag)
+    return url, None
+
+
+def _shift_date(match, n):
+    text = match.group(3).decode("utf-8", "replace").strip()
+    dt   = normalize_date(text)
+    if dt is None:
+        return match.group(0)
+    dt -= timedelta(hours=n)
+    if text[:4].isdigit():
+        shifted = dt.isoformat()
+    else:
+        shifted = dt.strftime("%a, %d %b %Y %H:%M:%S +0000")
+    return match.group(1) + shifted.encode() + match.group(4)
+
+
+def _synthesize_body(body, n):
+    # Give every synthetic copy its own ids and links, otherwise the
+    # copies would all dedup against the first one and the stress run
+    # would exercise nothing past the seen_ids lookup. Dates move back
+    # n hours too: piling thousands of copies onto the same few seconds
+    # makes adjust_duplicate_timestamps' collision walk quadratic, and the
+    # run would measure that instead of the pipeline.
+    body = re.sub(
+        rb"(<(pubDate|published|updated|dc:date)(?:\s[^>]*)?>)([^<]+)(</\2>)",
+        lambda m: _shift_date(m, n),
+        body,
+    )
+    suffix = f"#replay-{n}".encode()
+    body   = re.sub(
+        rb"(<(guid|link|url|id)(?:\s[^>]*)?>\s*<!\[CDATA\[)(.*?)(\]\]>\s*</\2>)",
+        lambda m: m.group(1) + m.group(3).strip() + suffix + m.group(4),
+        body,
+        flags=re.DOTALL,
+    )
+    return re.sub(
+        rb"(<(guid|link|url|id)(?:\s[^>]*)?>)([^<]+)(</\2>)",
+        lambda m: m.group(1) + m.group(3) + suffix + m.group(4),
+        body,
+    )
+
+
+def replay_feeds(count):
+    """Returns `count` feed URLs cycling through the captured corpus."""
+    global _capture_index
+    if _capture_index is None:
+        _capture_index = _load_capture_index(REPLAY_DIR)
+    captured = sorted(_capture_index)
+    if not captured:
+        return []
+    return [f"{captured[n % len(captured)]}#replay-{n}" for n in range(count)]
+
+
+def _replay_get(url, timeout):
+    global _capture_index, _replay_rng
+    if _capture_index is None:
+        _capture_index = _load_capture_index(REPLAY_DIR)
+    if _replay_rng is None:
+        _replay_rng = random.Random(REPLAY_SEED)
+
+    source, n = _synthetic_source(url)
+    record    = _capture_index.get(source)
+    if record is None:
+        raise requests.exceptions.ConnectionError(f"no recorded response for {source}")
+
+    if REPLAY_LATENCY == "recorded":
+        delay = record.get("elapsed", 0.0)
+    else:
+        delay = float(REPLAY_LATENCY)
+    if delay > timeout:
+        time.sleep(timeout)
+        raise requests.exceptions.Timeout()
+    if delay:
+        time.sleep(delay)
+
+    if REPLAY_FAIL_RATE and _replay_rng.random() < REPLAY_FAIL_RATE:
+        raise requests.exceptions.ConnectionError("injected replay failure")
+
+    error = record.get("error")
+    if error == "timeout":
+        raise requests.exceptions.Timeout()
+    if error == "connection":
+        raise requests.exceptions.ConnectionError(record.get("message", ""))
+    if error:
+        raise requests.exceptions.RequestException(record.get("message", ""))
+
+    with open(os.path.join(REPLAY_DIR, record["body"]), "rb") as f:
+        body = f.read()
+    if n is not None:
+        body = _synthesize_body(body, n)
+    return ReplayResponse(record["status"], record.get("headers", {}), body)
+
+
+def http_get(url, timeout=FETCH_TIMEOUT, headers=None):
+    """
+    requests.get() with record/replay support.
+    Raises the same requests exceptions as a live request would.
+    """
+    if REPLAY_DIR:
+        return _replay_get(url, timeout)
+
+    # A default run fetches each feed in update_master and again in
+    # update_empty_feeds; keep the bytes update_master actually processed.
+    record  = RECORD_DIR and url not in _recorded
+    started = time.perf_counter()
+    try:
+        resp = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
+    except requests.exceptions.RequestException as e:
+        if record:
+            if isinstance(e, requests.exceptions.Timeout):
+                kind = "timeout"
+            elif isinstance(e, requests.exceptions.ConnectionError):
+                kind = "connection"
+            else:
+                kind = "request"
+            _record(url, {
+                "error":   kind,
+                "message": str(e),
+                "elapsed": round(time.perf_counter() - started, 4),
+            })
+        raise
+
+    if record:
+        body_file = f"{_capture_key(url)}.body"
+        with open(os.path.join(RECORD_DIR, body_file), "wb") as f:
+            f.write(resp.content)
+        _record(url, {
+            "status":  resp.status_code,
+            "headers": dict(resp.headers),
+            "body":    body_file,
+            "elapsed": round(time.perf_counter() - started, 4),
+        })
+    return resp
+
+
+# -----------------------------
+# MEMORY ACCOUNTING
+# With tracing on (--memory-report / --memory-ceiling), each pipeline
+# stage is wrapped in memory_stage(), which records the traced peak and
+# the bytes still held when the stage ends, per stage and per feed.
+# When a stage ends with its peak over MEMORY_CEILING_MB, MemoryError is
+# raised; the check runs at stage exit, not while the stage is running.
+# -----------------------------
+
+_memory_stats = []   # (stage, feed | None, peak, peak - start, retained) in bytes
+
+
+@contextmanager
+def memory_stage(stage, feed=None):
+    if not tracemalloc.is_tracing():
+        yield
+        return
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    try:
+        yield
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        _memory_stats.append((stage, feed, peak, peak - before, current - before))
+    if MEMORY_CEILING_MB and peak > MEMORY_CEILING_MB * 1024 * 1024:
+        where = f"{stage} of {feed}" if feed else stage
+        raise MemoryError(
+            f"memory ceiling exceeded during {where}: "
+            f"peak {peak / 1048576:.1f} MB > {MEMORY_CEILING_MB} MB"
+        )
+
+
+def print_memory_report(top_feeds=MEMORY_REPORT_FEEDS):
+    if not _memory_stats:
+        return
+    mb = 1024 * 1024
+    print("\n[Memory report]  peak = traced total at the stage's high point,"
+          " +peak = rise above the stage's start, retained = still held after it")
+
+    # Per stage: peak and +peak are the max over all runs of the stage,
+    # retained is the sum over them (what the stage added overall).
+    stages = {}
+    for stage, _, peak, rise, retained in _memory_stats:
+        count, max_peak, max_rise, total = stages.get(stage, (0, 0, 0, 0))
+        stages[stage] = (count + 1, max(max_peak, peak), max(max_rise, rise), total + retained)
+    print(f"\n  per stage:  {'runs':>5} {'max peak MB':>12} {'max +peak MB':>13} {'sum retained MB':>16}")
+    for stage, (count, max_peak, max_rise, total) in stages.items():
+        print(f"  {stage:<11} {count:>5} {max_peak / mb:>12.2f} {max_rise / mb:>13.2f} {total / mb:>16.2f}")
+
+    # Per feed: +peak and retained for each of the feed's stages, plus the
+    # max +peak and summed retained across them.
+    feeds, feed_stages = {}, []
+    for stage, feed, _, rise, retained in _memory_stats:
+        if feed is None:
+            continue
+        if stage not in feed_stages:
+            feed_stages.append(stage)
+        per_stage = feeds.setdefault(feed, {})
+        old_rise, old_retained = per_stage.get(stage, (0, 0))
+        per_stage[stage] = (max(old_rise, rise), old_retained + retained)
+    ranked = sorted(feeds.items(),
+                    key=lambda kv: max(r for r, _ in kv[1].values()), reverse=True)
+    shown  = ranked[:top_feeds]
+    if shown:
+        print(f"\n  per feed, top {len(shown)} of {len(feeds)} by max +peak"
+              f"  (MB, +peak / retained per stage)")
+        header = "".join(f" {stage:>15}" for stage in feed_stages)
+        print(f"  {'max +peak':>9} {'sum retained':>12}{header}  feed")
+    for feed, per_stage in shown:
+        max_rise  = max(r for r, _ in per_stage.values())
+        total     = sum(k for _, k in per_stage.values())
+        cells     = ""
+        for stage in feed_stages:
+            if stage in per_stage:
+                rise, retained = per_stage[stage]
+                cells += f" {f'{rise / mb:.2f}/{retained / mb:.2f}':>15}"
+            else:
+                cells += f" {'-':>15}"
+        print(f"  {max_rise / mb:>9.2f} {total / mb:>12.2f}{cells}  {feed}")
+
+    overall = max(peak for _, _, peak, _, _ in _memory_stats)
+    limit   = f"{MEMORY_CEILING_MB} MB" if MEMORY_CEILING_MB else "none"
+    print(f"\n  run peak: {overall / mb:.2f} MB  (ceiling: {limit})")
+
+
 # -----------------------------
 # FEED FETCHER
 # -----------------------------
@@ -228,15 +813,15 @@ def fetch_feed(url, timeout=FETCH_TIMEOUT):
     When feed is None or feed.entries is empty, try parse_custom_xml(raw_bytes).
     """
     try:
-        resp = requests.get(
-            url,
-            timeout=timeout,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; feedparser/6.0)",
-                "Accept": "application/rss+xml, application/atom+xml, text/xml, */*",
-            },
-            allow_redirects=True,
-        )
+        with memory_stage("fetch", url):
+            resp = http_get(
+                url,
+                timeout=timeout,
+                headers={
+                    "User-Agent": "Mozilla/5.0 (compatible; feedparser/6.0)",
+                    "Accept": "application/rss+xml, application/atom+xml, text/xml, */*",
+                },
+            )
     except requests.exceptions.Timeout:
         return None, None, f"timeout after {timeout}s"
     except requests.exceptions.ConnectionError as e:
@@ -248,7 +833,9 @@ def fetch_feed(url, timeout=FETCH_TIMEOUT):
         return None, None, f"HTTP {resp.status_code}"
 
     raw  = resp.content
-    feed = feedparser.parse(raw)
+    resp = None   # drop the response object; only the body is needed from here
+    with memory_stage("parse", url):
+        feed = feedparser.parse(raw)
 
     if feed.bozo:
         exc = getattr(feed, "bozo_exception", "unknown")
@@ -263,20 +850,75 @@ def fetch_feed(url, timeout=FETCH_TIMEOUT):
 # CUSTOM XML PARSER
 # -----------------------------
 
-def parse_custom_xml(url_or_bytes):
+def _custom_article(article, feed=None):
+    def text(tag):
+        node = article.find(tag)
+        return (node.text or "").strip() if node is not None else ""
+
+    title    = text("title") or "No Title"
+    link     = text("url")
+    desc     = text("snippet")
+    pub_text = text("published")
+
+    dt = normalize_date(pub_text, feed) or datetime.now(timezone.utc)
+
+    entry_id = hashlib.md5(
+        f"{title}{link}{desc[:80]}".encode("utf-8")
+    ).hexdigest()
+
+    return {
+        "title":       title,
+        "link":        link,
+        "description": desc,
+        "pubDate":     dt.replace(microsecond=0),
+        "id":          entry_id,
+    }
+
+
+def _custom_rss_item(rss_item, feed=None):
+    def text(tag):
+        node = rss_item.find(tag)
+        return (node.text or "").strip() if node is not None else ""
+
+    title    = text("title") or "No Title"
+    link     = text("link")
+    desc     = text("description")
+    pub_text = text("pubDate")
+    guid     = text("guid") or link
+
+    dt = normalize_date(pub_text, feed) or datetime.now(timezone.utc)
+
+    entry_id = guid or hashlib.md5(
+        f"{title}{link}".encode("utf-8")
+    ).hexdigest()
+
+    return {
+        "title":       title,
+        "link":        link,
+        "description": desc,
+        "pubDate":     dt.replace(microsecond=0),
+        "id":          entry_id,
+    }
+
+
+def parse_custom_xml(url_or_bytes, stop_id=None, feed=None):
     """
     Fallback parser. Accepts bytes (from fetch_feed) or a URL string.
     Tries two schemas: custom <article> then standard RSS <item>.
+
+    The document is parsed incrementally. With stop_id set, reading stops
+    CURSOR_GUARD entries after the first entry whose id matches it; those
+    are the last ones returned. Used with the per-feed cursor so older entries are never read.
+    `feed` is passed to normalize_date() as the format hint key.
     """
     if isinstance(url_or_bytes, bytes):
         raw = url_or_bytes
     else:
         try:
-            resp = requests.get(
+            resp = http_get(
                 url_or_bytes,
                 timeout=FETCH_TIMEOUT,
                 headers={"User-Agent": "Mozilla/5.0 (compatible; feedparser/6.0)"},
-                allow_redirects=True,
             )
             if resp.status_code >= 400:
                 return []
@@ -284,100 +926,41 @@ def parse_custom_xml(url_or_bytes):
         except Exception:
             return []
 
-    try:
-        root = ET.fromstring(raw)
-    except ET.ParseError:
-        return []
-
     # ── Schema 1: custom <article> format ─────────────────────────────────
-    articles = root.findall(".//article")
-    if articles:
-        items = []
-        for article in articles:
-            try:
-                def text(tag, _el=article):
-                    node = _el.find(tag)
-                    return (node.text or "").strip() if node is not None else ""
-
-                title    = text("title") or "No Title"
-                link     = text("url")
-                desc     = text("snippet")
-                pub_text = text("published")
-
-                if pub_text:
-                    try:
-                        dt = parsedate_to_datetime(pub_text)
-                        if dt is None:
-                            raise ValueError
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=timezone.utc)
-                        dt = dt.astimezone(timezone.utc)
-                    except Exception:
-                        dt = datetime.now(timezone.utc)
-                else:
-                    dt = datetime.now(timezone.utc)
-
-                entry_id = hashlib.md5(
-                    f"{title}{link}{desc[:80]}".encode("utf-8")
-                ).hexdigest()
-
-                items.append({
-                    "title":       title,
-                    "link":        link,
-                    "description": desc,
-                    "pubDate":     dt.replace(microsecond=0),
-                    "id":          entry_id,
-                })
-            except Exception:
-                continue
-        return items
-
     # ── Schema 2: standard RSS <item> format ──────────────────────────────
-    rss_items = root.findall(".//item")
-    if not rss_items:
-        return []
-
-    items = []
-    for rss_item in rss_items:
-        try:
-            def text(tag, _el=rss_item):
-                node = _el.find(tag)
-                return (node.text or "").strip() if node is not None else ""
-
-            title    = text("title") or "No Title"
-            link     = text("link")
-            desc     = text("description")
-            pub_text = text("pubDate")
-            guid     = text("guid") or link
-
-            if pub_text:
+    # Both are collected while streaming; <article> wins if any were found.
+    articles  = []
+    rss_items = []
+    parser    = ET.XMLPullParser(events=("end",))
+    remaining = None   # entries still to read once stop_id has been seen
+    try:
+        for offset in range(0, len(raw), PARSE_CHUNK_SIZE):
+            parser.feed(raw[offset:offset + PARSE_CHUNK_SIZE])
+            for _, el in parser.read_events():
+                if el.tag == "article":
+                    target, build = articles, _custom_article
+                elif el.tag == "item":
+                    target, build = rss_items, _custom_rss_item
+                else:
+                    continue
                 try:
-                    dt = parsedate_to_datetime(pub_text)
-                    if dt is None:
-                        raise ValueError
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    dt = dt.astimezone(timezone.utc)
+                    item = build(el, feed)
                 except Exception:
-                    dt = datetime.now(timezone.utc)
-            else:
-                dt = datetime.now(timezone.utc)
-
-            entry_id = guid or hashlib.md5(
-                f"{title}{link}".encode("utf-8")
-            ).hexdigest()
-
-            items.append({
-                "title":       title,
-                "link":        link,
-                "description": desc,
-                "pubDate":     dt.replace(microsecond=0),
-                "id":          entry_id,
-            })
-        except Exception:
-            continue
+                    continue
+                finally:
+                    el.clear()
+                target.append(item)
+                if remaining is not None:
+                    remaining -= 1
+                elif stop_id is not None and item["id"] == stop_id:
+                    remaining = CURSOR_GUARD
+                if remaining == 0:
+                    return articles or rss_items
+        parser.close()
+    except ET.ParseError:
+        return []
 
-    return items
+    return articles or rss_items
 
 
 # -----------------------------
@@ -403,21 +986,7 @@ def load_existing(path):
                 desc     = desc_node.text          if desc_node  is not None and desc_node.text  else ""
                 guid     = guid_node.text.strip()  if guid_node  is not None and guid_node.text  else link or ""
                 pub_text = pub_node.text.strip()   if pub_node   is not None and pub_node.text   else None
-                if pub_text:
-                    try:
-                        dt = parsedate_to_datetime(pub_text)
-                        if dt is None:
-                            dt = datetime.now(timezone.utc)
-                        elif dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=timezone.utc)
-                        dt = dt.astimezone(timezone.utc)
-                    except Exception:
-                        try:
-                            dt = datetime.strptime(pub_text, "%a, %d %b %Y %H:%M:%S %z")
-                        except Exception:
-                            dt = datetime.now(timezone.utc)
-                else:
-                    dt = datetime.now(timezone.utc)
+                dt = normalize_date(pub_text, path) or datetime.now(timezone.utc)
                 dt = dt.replace(microsecond=0)
                 items.append({
                     "title":       title,
@@ -458,7 +1027,9 @@ def write_rss(items, path, title="Feed"):
         guid = ET.SubElement(node, "guid")
         guid.text = it.get("id", it.get("link", ""))
         guid.set("isPermaLink", "false")
-    xml_str = minidom.parseString(ET.tostring(rss)).toprettyxml(indent="  ")
+    dom     = minidom.parseString(ET.tostring(rss))
+    xml_str = dom.toprettyxml(indent="  ")
+    dom.unlink()   # minidom nodes form reference cycles; free them now, not at the next gc
     with open(path, "w", encoding="utf-8") as f:
         f.write(xml_str)
 
@@ -468,27 +1039,12 @@ def write_rss(items, path, title="Feed"):
 # -----------------------------
 
 def adjust_duplicate_timestamps(items):
-    from collections import defaultdict
     for item in items:
         dt = item.get("pubDate")
-        if not isinstance(dt, datetime):
-            try:
-                dt = parsedate_to_datetime(str(dt))
-                if dt is None:
-                    raise ValueError
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                dt = dt.astimezone(timezone.utc)
-            except Exception:
-                dt = datetime.now(timezone.utc)
+        if isinstance(dt, datetime):
+            dt = to_utc(dt)
         else:
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            else:
-                try:
-                    dt = dt.astimezone(timezone.utc)
-                except Exception:
-                    dt = dt.replace(tzinfo=timezone.utc)
+            dt = normalize_date(str(dt)) or datetime.now(timezone.utc)
         item["pubDate"] = dt.replace(microsecond=0)
 
     timestamp_groups = defaultdict(list)
@@ -527,27 +1083,126 @@ def adjust_duplicate_timestamps(items):
 # LOGIC: MASTER FEED
 # -----------------------------
 
-def update_master():
-    print("[Updating feed_master.xml]")
+def load_master_state():
+    """
+    Returns (existing, master_seen, seen_ids, cursors) for a master run.
+    seen_ids is the union of the current master and the persistent seen ids,
+    so both sources guard against re-addition.
+    """
+    with memory_stage("load"):
+        existing     = load_existing(MASTER_FILE)
+        existing_ids = {x["id"] for x in existing}
 
-    existing     = load_existing(MASTER_FILE)
-    existing_ids = {x["id"] for x in existing}
+        # Load persistent seen ids — these survive the MAX_ITEMS cap.
+        master_seen, master_seen_ids = load_master_seen()
+        seen_ids = existing_ids | master_seen_ids
+        cursors  = load_cursors()
+    return existing, master_seen, seen_ids, cursors
 
-    # Load persistent seen ids — these survive the MAX_ITEMS cap.
-    # Union with current master so both sources guard against re-addition.
-    master_seen, master_seen_ids = load_master_seen()
-    seen_ids = existing_ids | master_seen_ids
 
+def collect_feed(url, seen_ids, cursor):
+    """
+    Fetches and parses one feed. Does not touch seen_ids or any file.
+
+    Returns a result dict:
+      status:  "skip" | "empty" | "custom" | "ok"
+      warn:    fetch/parse problem, or None
+      items:   candidate new items — not in seen_ids, deduped within the feed
+      cursor:  updated high-water mark for the feed (absent on skip/empty)
+      entries / custom / scanned / dup:  counts for the run log
+    """
+    raw, feed, warn = fetch_feed(url)
+    result = {"url": url, "status": "skip", "warn": warn, "items": []}
+
+    if raw is None:
+        return result
+
+    entries = feed.entries if feed is not None else []
+    feed    = None   # only the entries are used from here on
+    stop_id = cursor_stop_id(cursor)
+    taken   = set()
+
+    # No feedparser entries — try custom XML using already-fetched bytes
+    if not entries:
+        with memory_stage("parse", url):
+            custom   = parse_custom_xml(raw, stop_id=stop_id, feed=url)
+            stop_hit = any(item["id"] == stop_id for item in custom)
+            if custom:
+                window, ids, _, new_cursor = scan_window(
+                    custom, lambda x: x["id"], lambda x: x["pubDate"], cursor, stop_id,
+                )
+                if stop_id and new_cursor["since_full_scan"] == 0 and stop_hit:
+                    # Fallback to a full scan (out of order, or an insert below
+                    # the cursor) — the parser stopped early, so parse the
+                    # whole document for it.
+                    custom = parse_custom_xml(raw, feed=url)
+                    window, ids, _, new_cursor = scan_window(
+                        custom, lambda x: x["id"], lambda x: x["pubDate"], cursor, stop_id,
+                    )
+            raw = None   # release the body before dedup
+        if not custom:
+            result["status"] = "empty"
+            return result
+        with memory_stage("dedup", url):
+            for item in window:
+                if item["id"] not in seen_ids and item["id"] not in taken:
+                    source        = extract_source(item["link"] or url)
+                    item["title"] = f"{clean_html(item['title'])}. [ {source} ]"
+                    item["description"] = clean_html(item["description"])
+                    result["items"].append(item)
+                    taken.add(item["id"])
+        result.update(status="custom", custom=len(custom), scanned=len(window),
+                      dup=0, cursor=new_cursor)
+        return result
+
+    # Normal feedparser path — only entries above the cursor are looked at
+    raw = None   # the body is only needed by the custom parser
+    with memory_stage("dedup", url):
+        window, ids, dates, new_cursor = scan_window(
+            entries, get_unique_id, lambda e: parse_date(e, url), cursor, stop_id,
+            total=len(entries),
+        )
+        skipped_dup = 0
+        for entry, entry_id, pub_dt in zip(window, ids, dates):
+            try:
+                if entry_id in seen_ids or entry_id in taken:
+                    skipped_dup += 1
+                    continue
+                link      = entry.get("link")    if isinstance(entry, dict) else getattr(entry, "link",    "")
+                raw_title = entry.get("title")   if isinstance(entry, dict) else getattr(entry, "title",   "No Title")
+                raw_desc  = entry.get("summary") if isinstance(entry, dict) else getattr(entry, "summary", "")
+                source    = extract_source(link)
+                result["items"].append({
+                    "title":       f"{clean_html(raw_title)}. [ {source} ]",
+                    "link":        link,
+                    "description": clean_html(raw_desc),
+                    "pubDate":     pub_dt,
+                    "id":          entry_id,
+                })
+                taken.add(entry_id)
+            except Exception:
+                continue
+
+    result.update(status="ok", entries=len(entries), scanned=len(window),
+                  dup=skipped_dup, cursor=new_cursor)
+    return result
+
+
+def merge_master(results, existing, master_seen, seen_ids, cursors):
+    """
+    Applies cross-feed dedup to collect_feed() results (in FEEDS order),
+    persists seen ids and cursors, and renders master + empty report.
+    """
     now_iso       = datetime.now(timezone.utc).isoformat()
     new_items     = []
     empty_reports = []
 
     ok_count = warn_count = skip_count = 0
 
-    for url in FEEDS:
-        raw, feed, warn = fetch_feed(url)
+    for res in results:
+        url, warn = res["url"], res["warn"]
 
-        if raw is None:
+        if res["status"] == "skip":
             skip_count += 1
             print(f"  [SKIP] {url}")
             print(f"         {warn}")
@@ -567,80 +1222,51 @@ def update_master():
         else:
             ok_count += 1
 
-        entries = feed.entries if feed is not None else []
-
-        # No feedparser entries — try custom XML using already-fetched bytes
-        if not entries:
-            custom = parse_custom_xml(raw)
-            if custom:
-                added = 0
-                for item in custom:
-                    if item["id"] not in seen_ids:
-                        source        = extract_source(item["link"] or url)
-                        item["title"] = f"{clean_html(item['title'])}. [ {source} ]"
-                        item["description"] = clean_html(item["description"])
-                        new_items.append(item)
-                        seen_ids.add(item["id"])
-                        master_seen[item["id"]] = now_iso   # mark as seen persistently
-                        added += 1
-                print(
-                    f"  [CUSTOM] {url}\n"
-                    f"           entries=0 (feedparser)  custom={len(custom)}  new={added}"
-                )
-            else:
-                print(f"  [EMPTY] {url}\n          entries=0  custom=0")
-                empty_reports.append({
-                    "title":       f"Empty feed: {url}",
-                    "link":        url,
-                    "description": "No articles in feedparser or custom XML format.",
-                    "pubDate":     datetime.now(timezone.utc).replace(microsecond=0),
-                    "id":          f"empty_{hashlib.md5(url.encode()).hexdigest()}",
-                })
+        if res["status"] == "empty":
+            print(f"  [EMPTY] {url}\n          entries=0  custom=0")
+            empty_reports.append({
+                "title":       f"Empty feed: {url}",
+                "link":        url,
+                "description": "No articles in feedparser or custom XML format.",
+                "pubDate":     datetime.now(timezone.utc).replace(microsecond=0),
+                "id":          f"empty_{hashlib.md5(url.encode()).hexdigest()}",
+            })
             continue
 
-        # Normal feedparser path
-        added = skipped_dup = 0
-        for entry in entries:
-            try:
-                entry_id = get_unique_id(entry)
-                if entry_id in seen_ids:
-                    skipped_dup += 1
-                    continue
-                link      = entry.get("link")    if isinstance(entry, dict) else getattr(entry, "link",    "")
-                raw_title = entry.get("title")   if isinstance(entry, dict) else getattr(entry, "title",   "No Title")
-                raw_desc  = entry.get("summary") if isinstance(entry, dict) else getattr(entry, "summary", "")
-                source    = extract_source(link)
-                new_items.append({
-                    "title":       f"{clean_html(raw_title)}. [ {source} ]",
-                    "link":        link,
-                    "description": clean_html(raw_desc),
-                    "pubDate":     parse_date(entry),
-                    "id":          entry_id,
-                })
-                seen_ids.add(entry_id)
-                master_seen[entry_id] = now_iso   # mark as seen persistently
-                added += 1
-            except Exception:
+        cursors[url] = res["cursor"]
+        added = 0
+        skipped_dup = res["dup"]
+        for item in res["items"]:
+            if item["id"] in seen_ids:     # already taken by an earlier feed
+                skipped_dup += 1
                 continue
-
-        print(
-            f"  [OK]   {url}\n"
-            f"         entries={len(entries)}  new={added}  dup={skipped_dup}"
-        )
+            new_items.append(item)
+            seen_ids.add(item["id"])
+            master_seen[item["id"]] = now_iso   # mark as seen persistently
+            added += 1
+
+        if res["status"] == "custom":
+            print(
+                f"  [CUSTOM] {url}\n"
+                f"           entries=0 (feedparser)  custom={res['custom']}"
+                f"  scanned={res['scanned']}  new={added}"
+            )
+        else:
+            print(
+                f"  [OK]   {url}\n"
+                f"         entries={res['entries']}  scanned={res['scanned']}  new={added}  dup={skipped_dup}"
+            )
 
     print(
         f"\n  feeds: {ok_count} ok / {warn_count} warn / {skip_count} skipped"
-        f" / {len(FEEDS)} total"
+        f" / {len(results)} total"
     )
 
-    # Persist seen ids before trimming — so every processed id is remembered
-    # even if it gets evicted from master by the MAX_ITEMS cap.
-    save_master_seen(master_seen)
-
-    all_items = existing + new_items
-    all_items = adjust_duplicate_timestamps(all_items)
-    all_items.sort(key=lambda x: x["pubDate"], reverse=True)
-    all_items = all_items[:MAX_ITEMS]
+    with memory_stage("merge"):
+        all_items = existing + new_items
+        all_items = adjust_duplicate_timestamps(all_items)
+        all_items.sort(key=lambda x: x["pubDate"], reverse=True)
+        all_items = all_items[:MAX_ITEMS]
 
     if not all_items:
         all_items = [{
@@ -651,12 +1277,128 @@ def update_master():
             "id":          "init_1",
         }]
 
-    write_rss(all_items, MASTER_FILE, "Master Feed (Updated every 30 mins)")
-    write_rss(empty_reports, EMPTY_FILE, "Empty Feeds Report")
+    with memory_stage("render"):
+        write_rss(all_items, MASTER_FILE, "Master Feed (Updated every 30 mins)")
+        write_rss(empty_reports, EMPTY_FILE, "Empty Feeds Report")
+
+    # Persist only once master is written — if a stage fails (e.g. the memory
+    # ceiling), the new ids and cursors must not be marked seen. master_seen
+    # holds every processed id, including ones trimmed by the MAX_ITEMS cap.
+    save_master_seen(master_seen)
+    save_cursors(cursors)
     print(f"✓ feed_master.xml updated with {len(all_items)} items ({len(new_items)} new)")
     print(f"✓ empty_feeds.xml written with {len(empty_reports)} entries")
 
 
+def update_master():
+    print("[Updating feed_master.xml]")
+
+    existing, master_seen, seen_ids, cursors = load_master_state()
+    results = [collect_feed(url, seen_ids, cursors.get(url, {})) for url in FEEDS]
+    merge_master(results, existing, master_seen, seen_ids, cursors)
+
+
+# -----------------------------
+# SHARDED MASTER
+# `--shard i/N` runs collect_feed() over a deterministic subset of FEEDS
+# and writes the results to PARTIAL_DIR. `--merge` reads every partial
+# back in FEEDS order and runs the same merge_master() stage, so the
+# output matches a single-process update_master() on the same inputs.
+# Each partial carries a fingerprint of the state it was collected
+# against; partials from an earlier run are rejected, and a successful
+# merge deletes them.
+# -----------------------------
+
+def shard_of(url, shard_count):
+    # Hash-based so a feed keeps its shard when FEEDS is reordered or grows.
+    return int(hashlib.md5(url.encode("utf-8")).hexdigest()[:8], 16) % shard_count
+
+
+def state_fingerprint():
+    """md5 over the master state files a shard collects against."""
+    digest = hashlib.md5()
+    for path in (MASTER_FILE, MASTER_SEEN_FILE, CURSOR_FILE):
+        digest.update(path.encode("utf-8") + b"\0")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def partial_path(shard, shard_count):
+    return os.path.join(PARTIAL_DIR, f"master_{shard}_of_{shard_count}.json")
+
+
+def update_master_shard(shard, shard_count):
+    print(f"[Collecting shard {shard}/{shard_count}]")
+
+    state = state_fingerprint()
+    _, _, seen_ids, cursors = load_master_state()
+    feeds   = [url for url in FEEDS if shard_of(url, shard_count) == shard]
+    results = [collect_feed(url, seen_ids, cursors.get(url, {})) for url in feeds]
+
+    for res in results:
+        for item in res["items"]:
+            item["pubDate"] = item["pubDate"].isoformat()
+
+    os.makedirs(PARTIAL_DIR, exist_ok=True)
+    path = partial_path(shard, shard_count)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"shard": shard, "shards": shard_count, "state": state,
+                   "results": results}, f, separators=(",", ":"))
+    print(f"✓ {path} written with {len(results)} feeds")
+
+
+def merge_master_shards():
+    print("[Merging shards into feed_master.xml]")
+
+    if not os.path.isdir(PARTIAL_DIR):
+        sys.exit(f"no partial results in {PARTIAL_DIR}/")
+    partials, paths = [], []
+    for name in sorted(os.listdir(PARTIAL_DIR)):
+        if name.startswith("master_") and name.endswith(".json"):
+            paths.append(os.path.join(PARTIAL_DIR, name))
+            with open(paths[-1], "r", encoding="utf-8") as f:
+                partials.append(json.load(f))
+    if not partials:
+        sys.exit(f"no partial results in {PARTIAL_DIR}/")
+
+    # A shard that failed this run would otherwise leave last run's file
+    # behind, bringing back stale items and rewinding its cursors.
+    state = state_fingerprint()
+    stale = [path for path, p in zip(paths, partials) if p.get("state") != state]
+    if stale:
+        sys.exit(
+            f"{len(stale)} partials were collected against a different state"
+            f" than the current one, e.g. {stale[0]}; re-run those shards"
+        )
+
+    counts = {p["shards"] for p in partials}
+    if len(counts) != 1:
+        sys.exit(f"partials in {PARTIAL_DIR}/ come from different shard counts: {sorted(counts)}")
+    shard_count = counts.pop()
+    missing = set(range(shard_count)) - {p["shard"] for p in partials}
+    if missing:
+        sys.exit(f"missing shards {sorted(missing)} of {shard_count}")
+
+    by_url = {}
+    for p in partials:
+        for res in p["results"]:
+            for item in res["items"]:
+                item["pubDate"] = datetime.fromisoformat(item["pubDate"])
+            by_url[res["url"]] = res
+    unknown = [url for url in FEEDS if url not in by_url]
+    if unknown:
+        sys.exit(f"no shard result for {len(unknown)} feeds, e.g. {unknown[0]}")
+
+    existing, master_seen, seen_ids, cursors = load_master_state()
+    merge_master([by_url[url] for url in FEEDS], existing, master_seen, seen_ids, cursors)
+
+    for path in paths:
+        os.remove(path)
+
+
 # -----------------------------
 # LOGIC: DAILY
 # -----------------------------
@@ -664,18 +1406,21 @@ def update_master():
 def update_daily():
     print("[Updating daily_feed.xml]")
 
-    history_ids, history = load_seen()
-    master = load_existing(MASTER_FILE)
-    master.sort(key=lambda x: x["pubDate"], reverse=True)
+    with memory_stage("load"):
+        history_ids, history = load_seen()
+        master = load_existing(MASTER_FILE)
+        master.sort(key=lambda x: x["pubDate"], reverse=True)
 
     now_iso     = datetime.now(timezone.utc).isoformat()
     daily_items = []
-    for it in master:
-        if it["id"] not in history_ids:
-            it["title"]       = clean_html(it["title"])
-            it["description"] = clean_html(it["description"])
-            daily_items.append(it)
-            history[it["id"]] = now_iso
+    with memory_stage("dedup"):
+        for it in master:
+            if it["id"] not in history_ids:
+                it["title"]       = clean_html(it["title"])
+                it["description"] = clean_html(it["description"])
+                daily_items.append(it)
+                history[it["id"]] = now_iso
+        master = None
 
     if not daily_items:
         daily_items = [{
@@ -686,8 +1431,9 @@ def update_daily():
             "id":          f"msg_{int(datetime.now(timezone.utc).timestamp())}",
         }]
 
-    write_rss(daily_items, DAILY_FILE, "Daily Feed (New Items Only)")
-    save_seen(history)
+    with memory_stage("render"):
+        write_rss(daily_items, DAILY_FILE, "Daily Feed (New Items Only)")
+        save_seen(history)
 
     sources = set()
     for item in daily_items:
@@ -728,7 +1474,7 @@ def update_empty_feeds():
         entries = feed.entries if feed is not None else []
 
         if not entries:
-            custom = parse_custom_xml(raw)  # reuse fetched bytes — no second request
+            custom = parse_custom_xml(raw, feed=url)  # reuse fetched bytes — no second request
             if not custom:
                 empty_count += 1
                 print(f"  [EMPTY] {url}")
@@ -757,9 +1503,46 @@ def update_empty_feeds():
 # MAIN
 # -----------------------------
 
-if __name__ == "__main__":
-    args = sys.argv[1:]
-    if "--master-only" in args:
+def arg_value(args, flag, default=None):
+    """Value following `flag` in args, e.g. arg_value(args, "--record")."""
+    if flag in args:
+        i = args.index(flag)
+        if i + 1 < len(args):
+            return args[i + 1]
+        sys.exit(f"{flag} needs a value")
+    return default
+
+
+def arg_number(args, flag, convert, default, valid, expected):
+    """
+    Numeric flag value, or default when absent. Exits with a usage message
+    when the value doesn't convert or fails `valid`.
+    """
+    raw = arg_value(args, flag)
+    if raw is None:
+        return default
+    try:
+        value = convert(raw)
+    except ValueError:
+        value = None
+    if value is None or not valid(value):
+        sys.exit(f"{flag} expects {expected}, got {raw!r}")
+    return value
+
+
+def run(args):
+    shard = arg_value(args, "--shard")
+    if shard:
+        try:
+            index, count = (int(n) for n in shard.split("/"))
+        except ValueError:
+            sys.exit("--shard expects i/N, e.g. --shard 0/4")
+        if not 0 <= index < count:
+            sys.exit(f"--shard {shard}: i must be in 0..N-1")
+        update_master_shard(index, count)
+    elif "--merge" in args:
+        merge_master_shards()
+    elif "--master-only" in args:
         update_master()
     elif "--daily-only" in args:
         update_daily()
@@ -769,3 +1552,43 @@ if __name__ == "__main__":
         update_master()
         update_daily()
         update_empty_feeds()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+
+    RECORD_DIR = arg_value(args, "--record")
+    REPLAY_DIR = arg_value(args, "--replay")
+    if RECORD_DIR and REPLAY_DIR:
+        sys.exit("--record and --replay are mutually exclusive")
+    if REPLAY_DIR:
+        if arg_value(args, "--replay-latency") == "recorded":
+            REPLAY_LATENCY = "recorded"
+        else:
+            REPLAY_LATENCY = arg_number(args, "--replay-latency", float, 0.0,
+                                        lambda v: v >= 0, "seconds >= 0 or 'recorded'")
+        REPLAY_FAIL_RATE = arg_number(args, "--replay-fail-rate", float, 0.0,
+                                      lambda v: 0 <= v <= 1, "a fraction between 0 and 1")
+        REPLAY_SEED      = arg_number(args, "--replay-seed", int, 0,
+                                      lambda v: True, "an integer")
+        REPLAY_SCALE     = arg_number(args, "--replay-scale", int, 0,
+                                      lambda v: v >= 0, "a feed count >= 0")
+        if REPLAY_SCALE:
+            FEEDS = replay_feeds(REPLAY_SCALE)
+        REPLAY_OUT_DIR = start_replay(arg_value(args, "--replay-out"))
+        print(f"[Replaying HTTP from {REPLAY_DIR}, writing to {REPLAY_OUT_DIR}]")
+    elif RECORD_DIR:
+        start_recording()
+        print(f"[Recording HTTP to {RECORD_DIR}]")
+
+    MEMORY_REPORT = "--memory-report" in args
+    MEMORY_CEILING_MB = arg_number(args, "--memory-ceiling", float, MEMORY_CEILING_MB,
+                                   lambda v: v > 0, "a size in MB > 0")
+    if MEMORY_REPORT or MEMORY_CEILING_MB:
+        tracemalloc.start()
+
+    try:
+        run(args)
+    finally:
+        if MEMORY_REPORT:
+            print_memory_report()